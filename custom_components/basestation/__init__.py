@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from homeassistant.components import bluetooth
-from homeassistant.components.bluetooth import BluetoothCallbackMatcher, BluetoothChange
+from homeassistant.components.bluetooth import BluetoothCallbackMatcher
 from homeassistant.components.bluetooth.match import ADDRESS
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS, Platform
-from homeassistant.core import HomeAssistant, callback
 
 from .coordinator import BasestationCoordinator
 from .lib import BasestationAPI
 
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
 PLATFORMS: list[Platform] = [Platform.BUTTON, Platform.SELECT, Platform.SWITCH]
 
 type BasestationConfigEntry = ConfigEntry[BasestationCoordinator]
@@ -19,26 +23,17 @@ type BasestationConfigEntry = ConfigEntry[BasestationCoordinator]
 
 async def async_setup_entry(hass: HomeAssistant, entry: BasestationConfigEntry) -> bool:
     """Set up config entry."""
-    address: str = entry.data[CONF_ADDRESS]
+    address: str = entry.data[CONF_ADDRESS].upper()
     ble_device = bluetooth.async_ble_device_from_address(
-        hass, address.upper(), connectable=True
+        hass, address, connectable=True
     )
 
     basestation_ble = BasestationAPI(ble_device)
 
-    @callback
-    def _async_update_ble(
-        service_info: bluetooth.BluetoothServiceInfoBleak,
-        _: BluetoothChange,
-    ) -> None:
-        basestation_ble.set_ble_device_and_advertisement_data(
-            service_info.device, service_info.advertisement
-        )
-
     entry.async_on_unload(
         bluetooth.async_register_callback(
             hass,
-            _async_update_ble,
+            basestation_ble.update_from_service_info,
             BluetoothCallbackMatcher({ADDRESS: address}),
             bluetooth.BluetoothScanningMode.PASSIVE,
         )
@@ -58,5 +53,5 @@ async def async_unload_entry(
     hass: HomeAssistant, entry: BasestationConfigEntry
 ) -> bool:
     """Unload callback."""
-    await entry.runtime_data.basestation_ble.disconnect()
+    await entry.runtime_data.basestation_ble.stop()
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -31,11 +31,13 @@ class BasestationIdentifyButton(BasestationEntity, ButtonEntity):
         coordinator: BasestationCoordinator,
     ) -> None:
         """Initialize the button."""
-        super().__init__(coordinator)
-        self.entity_description = ButtonEntityDescription(
-            key="identify",
-            name="Identify",
-            device_class=ButtonDeviceClass.IDENTIFY,
+        super().__init__(
+            coordinator,
+            ButtonEntityDescription(
+                key="identify",
+                name="Identify",
+                device_class=ButtonDeviceClass.IDENTIFY,
+            ),
         )
 
     async def async_press(self) -> None:
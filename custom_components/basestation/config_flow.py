@@ -72,6 +72,8 @@ class BasestationConfigFlow(ConfigFlow, domain=DOMAIN):
                         CONF_ADDRESS: discovery_info.address,
                     },
                 )
+            finally:
+                await basestation_ble.disconnect()
 
         if discovery := self._discovery_info:
             self._discovered_devices[format_mac(discovery.address)] = discovery
@@ -2,4 +2,5 @@
 
 DOMAIN = "basestation"
 DEVICE_TIMEOUT = 10
+CONNECT_TIMEOUT = 60
 UPDATE_INTERVAL_SECONDS = 30
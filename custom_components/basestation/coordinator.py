@@ -9,7 +9,7 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import UPDATE_INTERVAL_SECONDS
+from .const import CONNECT_TIMEOUT, DEVICE_TIMEOUT, UPDATE_INTERVAL_SECONDS
 from .lib import BasestationAPI, BasestationState
 
 _LOGGER = logging.getLogger(__name__)
@@ -37,7 +37,11 @@ class BasestationCoordinator(DataUpdateCoordinator):
 
     async def _async_update_data(self) -> BasestationState:
         try:
-            async with timeout(10):
+            # Connect before the device timeout starts, the connection may have
+            # to wait for other Base Stations to finish connecting first.
+            async with timeout(CONNECT_TIMEOUT):
+                await self.basestation_ble.connect()
+            async with timeout(DEVICE_TIMEOUT):
                 return await self.basestation_ble.update()
         except Exception as ex:
             raise UpdateFailed(str(ex)) from ex
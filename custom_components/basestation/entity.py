@@ -1,10 +1,13 @@
 """Base Station base entity."""
 
+from homeassistant.core import callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import BasestationCoordinator
+from .lib import BasestationState
 
 
 class BasestationEntity(CoordinatorEntity[BasestationCoordinator]):
@@ -12,42 +15,43 @@ class BasestationEntity(CoordinatorEntity[BasestationCoordinator]):
 
     _attr_has_entity_name = True
 
-    def __init__(self, coordinator: BasestationCoordinator) -> None:
+    def __init__(
+        self,
+        coordinator: BasestationCoordinator,
+        entity_description: EntityDescription,
+    ) -> None:
         """Initialize the entity."""
         super().__init__(coordinator)
+        self.entity_description = entity_description
 
-    @property
-    def unique_id(self) -> str:
-        """Return a formatted unique ID."""
-        uid = dr.format_mac(self.coordinator.basestation_ble.address)
-        if self.entity_description and self.entity_description.key:
-            uid += f"_{self.entity_description.key}"
-
-        return uid
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
+        basestation_ble = coordinator.basestation_ble
+        self._attr_unique_id = (
+            f"{dr.format_mac(basestation_ble.address)}_{entity_description.key}"
+        )
+        self._attr_device_info = DeviceInfo(
             connections={
                 (
                     dr.CONNECTION_BLUETOOTH,
-                    self.coordinator.basestation_ble.address,
+                    basestation_ble.address,
                 )
             },
-            name=self.coordinator.basestation_ble.name,
-            manufacturer=self.coordinator.basestation_ble.manufacturer,
-            model_id=self.coordinator.basestation_ble.model_id,
-            model=self.coordinator.basestation_ble.model,
-            sw_version=self.coordinator.basestation_ble.sw_version,
-            serial_number=self.coordinator.basestation_ble.serial_number,
+            name=basestation_ble.name,
+            manufacturer=basestation_ble.manufacturer,
+            model_id=basestation_ble.model_id,
+            model=basestation_ble.model,
+            sw_version=basestation_ble.sw_version,
+            serial_number=basestation_ble.serial_number,
         )
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         self.async_on_remove(
             self.coordinator.basestation_ble.register_callback(
-                lambda _: self._handle_coordinator_update()
+                self._handle_state_update
             )
         )
         return await super().async_added_to_hass()
+
+    @callback
+    def _handle_state_update(self, _: BasestationState) -> None:
+        self._handle_coordinator_update()
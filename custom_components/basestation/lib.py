@@ -2,9 +2,10 @@
 
 import asyncio
 import logging
-from collections.abc import Callable, Iterable
-from dataclasses import dataclass, replace
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from contextlib import asynccontextmanager
 from enum import Enum
+from typing import Any, NamedTuple
 from uuid import UUID
 
 from bleak import (
@@ -14,6 +15,7 @@ from bleak import (
     BLEDevice,
 )
 from bleak_retry_connector import (
+    BLEAK_EXCEPTIONS,
     BleakClientWithServiceCache,
     establish_connection,
     retry_bluetooth_connection_error,
@@ -23,8 +25,13 @@ from habluetooth import BluetoothServiceInfoBleak
 _LOGGER = logging.getLogger(__name__)
 
 BLE_RETRY_ATTEMPTS = 3
+MAX_CONCURRENT_CONNECTS = 1
+GATT_TIMEOUT_SECONDS = 5
+WRITE_DEBOUNCE_SECONDS = 0.15
+DISCONNECT_DELAY_SECONDS = 3
 MANUFACTURER_ID = 1373
 NAME_PREFIX = "LHB-"
+_NAME_PREFIX_LEN = len(NAME_PREFIX)
 
 CHARACTERISTIC_UUID_MODEL_ID = "2a24"
 CHARACTERISTIC_UUID_SERIAL_NUMBER = "2a25"
@@ -38,37 +45,39 @@ CHARACTERISTIC_UUID_CHANNEL = "00001524-1212-efde-1523-785feabcd124"
 CHANNEL_NUM_MIN = 1
 CHANNEL_NUM_MAX = 16
 
+# Shared by all Base Stations so they don't compete for the adapter while connecting
+_CONNECT_SEMAPHORE = asyncio.Semaphore(MAX_CONCURRENT_CONNECTS)
 
-def model_name(num: str) -> str:
-    """Convert the model number to a name."""
-    models = {
-        "1004": "SteamVR Base Station 2.0",
-    }
-
-    if num in models:
-        return models[num]
-
-    return "Unknown"
+_MODELS = {
+    "1004": "SteamVR Base Station 2.0",
+}
 
 
-def _is_basestation_device(info: BluetoothServiceInfoBleak) -> bool:
-    return info.manufacturer_id == MANUFACTURER_ID and info.name.startswith(NAME_PREFIX)
+def model_name(num: str) -> str:
+    """Convert the model number to a name."""
+    return _MODELS.get(num, "Unknown")
 
 
 def filter_discoveries(
     discoveries: Iterable[BluetoothServiceInfoBleak],
-) -> Iterable[BluetoothServiceInfoBleak]:
+) -> Iterator[BluetoothServiceInfoBleak]:
     """Filter for discoveries that are Base Stations."""
-    return [i for i in discoveries if _is_basestation_device(i)]
+    return (
+        i
+        for i in discoveries
+        if MANUFACTURER_ID in i.manufacturer_data
+        and i.name
+        and i.name[:_NAME_PREFIX_LEN] == NAME_PREFIX
+    )
 
 
 def _require_characteristic(
     services: BleakGATTServiceCollection, specifier: int | str | UUID
 ) -> BleakGATTCharacteristic:
     char = services.get_characteristic(specifier)
-    if not char:
-        msg = "Characteristic not found"
-        raise ValueError(msg)
+    if char is None:
+        msg = f"Characteristic {specifier} not found"
+        raise LookupError(msg)
     return char
 
 
@@ -82,13 +91,16 @@ class BasestationStatePower(Enum):
     AWAKE_AFTER_STANDBY = 0x0B
 
 
-@dataclass(frozen=True)
-class BasestationState:
+_IDENTIFY_PAYLOAD = b"\x01"
+_POWER_PAYLOADS = {power: bytes((power.value,)) for power in BasestationStatePower}
+_CHANNEL_PAYLOADS = tuple(bytes((channel,)) for channel in range(CHANNEL_NUM_MAX + 1))
+
+
+class BasestationState(NamedTuple):
     """State of a Base Station."""
 
-    power: BasestationStatePower = None
-    channel: int = None
-    sw_version: str = None
+    power: BasestationStatePower | None = None
+    channel: int | None = None
 
 
 class BasestationAPI:
@@ -102,13 +114,25 @@ class BasestationAPI:
         self._advertisement_data = advertisement_data
 
         self._client: BleakClientWithServiceCache | None = None
+        self._chars: dict[str, BleakGATTCharacteristic] = {}
         self._connect_lock: asyncio.Lock = asyncio.Lock()
-        self._callbacks: list[Callable[[BasestationState], None]] = []
+        self._disconnect_handle: asyncio.TimerHandle | None = None
+        self._disconnect_task: asyncio.Task[None] | None = None
+        self._active_operations = 0
+        self._callbacks: set[Callable[[BasestationState], None]] = set()
+
+        self._pending_writes: dict[str, bytes] = {}
+        self._pending_write_waiters: list[asyncio.Future[None]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+        self._write_lock = asyncio.Lock()
+        self._update_task: asyncio.Task[BasestationState] | None = None
 
         self._state = BasestationState()
         self._manufacturer: str | None = None
         self._model_id: str | None = None
         self._serial_number: str | None = None
+        self._sw_version: str | None = None
 
     @property
     def address(self) -> str:
@@ -141,9 +165,9 @@ class BasestationAPI:
         return self._serial_number
 
     @property
-    def sw_version(self) -> str:
+    def sw_version(self) -> str | None:
         """Get the software version."""
-        return self._state.sw_version
+        return self._sw_version
 
     @property
     def rssi(self) -> int | None:
@@ -166,49 +190,55 @@ class BasestationAPI:
         ]
 
     @property
-    def channel(self) -> int:
+    def channel(self) -> int | None:
         """Get the current channel."""
         return self._state.channel
 
-    def set_ble_device_and_advertisement_data(
-        self, ble_device: BLEDevice, advertisement_data: AdvertisementData
+    def update_from_service_info(
+        self, service_info: BluetoothServiceInfoBleak, _change: Any
     ) -> None:
-        """Set the BLE device and advertisement data."""
-        self._ble_device = ble_device
-        self._advertisement_data = advertisement_data
+        """Update the BLE device and advertisement data from a Bluetooth callback."""
+        self._ble_device = service_info.device
+        self._advertisement_data = service_info.advertisement
 
     async def update(self) -> BasestationState:
         """Update the state data."""
+        # Concurrent callers share a single update instead of each reading the
+        # characteristics again.
+        if self._update_task is None or self._update_task.done():
+            self._update_task = asyncio.get_running_loop().create_task(self._update())
+        return await asyncio.shield(self._update_task)
+
+    async def _update(self) -> BasestationState:
         _LOGGER.debug("%s (%s): Updating data", self.name, self.address)
-        try:
+        async with self._operation():
             if (
                 self._serial_number is None
             ):  # only initialise once, not expected to change
-                self._model_id = (
-                    await self._read_char(CHARACTERISTIC_UUID_MODEL_ID)
-                ).decode()
-                self._manufacturer = (
-                    await self._read_char(CHARACTERISTIC_UUID_MANUFACTURER)
-                ).decode()
-                self._serial_number = (
-                    await self._read_char(CHARACTERISTIC_UUID_SERIAL_NUMBER)
-                ).decode()
-
-            power = BasestationStatePower(
-                (await self._read_char(CHARACTERISTIC_UUID_POWER))[0]
+                (
+                    model_id,
+                    manufacturer,
+                    serial_number,
+                    sw_version,
+                ) = await self._read_chars(
+                    CHARACTERISTIC_UUID_MODEL_ID,
+                    CHARACTERISTIC_UUID_MANUFACTURER,
+                    CHARACTERISTIC_UUID_SERIAL_NUMBER,
+                    CHARACTERISTIC_UUID_SW_VERSION,
+                )
+                self._model_id = model_id.decode()
+                self._manufacturer = manufacturer.decode()
+                self._serial_number = serial_number.decode()
+                self._sw_version = sw_version.decode()
+
+            power, channel = await self._read_chars(
+                CHARACTERISTIC_UUID_POWER,
+                CHARACTERISTIC_UUID_CHANNEL,
             )
-            channel = int.from_bytes(await self._read_char(CHARACTERISTIC_UUID_CHANNEL))
-            sw_version = (
-                await self._read_char(CHARACTERISTIC_UUID_SW_VERSION)
-            ).decode()
-        finally:
-            await self.disconnect()
 
-        self._state = BasestationState(
-            power=power,
-            channel=channel,
-            sw_version=sw_version,
-        )
+        new_state = (BasestationStatePower(power[0]), channel[0])
+        if new_state != self._state:  # keep the current instance when unchanged
+            self._state = BasestationState(*new_state)
 
         _LOGGER.debug("%s (%s): Updated data: %s", self.name, self.address, self.state)
         return self.state
@@ -218,12 +248,10 @@ class BasestationAPI:
         _LOGGER.debug(
             "%s (%s): Setting power state to %s", self.name, self.address, power
         )
-        await self._write_char(
-            CHARACTERISTIC_UUID_POWER,
-            [power.value.to_bytes()],
-            disconnect=True,
+        await self._write_char_debounced(
+            CHARACTERISTIC_UUID_POWER, _POWER_PAYLOADS[power]
         )
-        self._state = replace(self._state, power=power)
+        self._state = self._state._replace(power=power)
         self._fire_callbacks()
 
     async def set_power_on(self) -> None:
@@ -243,26 +271,42 @@ class BasestationAPI:
         _LOGGER.debug(
             "%s (%s): Setting channel to %s", self.name, self.address, channel
         )
-        await self._write_char(
-            CHARACTERISTIC_UUID_CHANNEL, [channel.to_bytes()], disconnect=True
+        await self._write_char_debounced(
+            CHARACTERISTIC_UUID_CHANNEL, _CHANNEL_PAYLOADS[channel]
         )
         # Channel change will turn on the device automatically
-        self._state = replace(
-            self._state, channel=channel, power=BasestationStatePower.AWAKE
+        self._state = self._state._replace(
+            power=BasestationStatePower.AWAKE, channel=channel
         )
         self._fire_callbacks()
 
     async def identify(self) -> None:
         """Trigger the identify action."""
         _LOGGER.debug("%s (%s): Identifying", self.name, self.address)
-        await self._write_char(CHARACTERISTIC_UUID_IDENTIFY, [0x01.to_bytes()], disconnect=True)
+        await self._write_char_debounced(
+            CHARACTERISTIC_UUID_IDENTIFY, _IDENTIFY_PAYLOAD
+        )
 
         # Identify will turn on the device automatically
-        self._state = replace(self._state, power=BasestationStatePower.AWAKE)
+        self._state = self._state._replace(power=BasestationStatePower.AWAKE)
         self._fire_callbacks()
 
     async def connect(self) -> None:
         """Connect."""
+        self._cancel_disconnect()
+        try:
+            await self._connect()
+        finally:
+            if self._client and not self._active_operations:
+                # Connected ahead of an operation, e.g. by the coordinator, so
+                # release the connection again if no operation follows.
+                self._schedule_disconnect()
+
+    async def _connect(self) -> None:
+        if self._disconnect_task and not self._disconnect_task.done():
+            # let an idle disconnect that already started finish first
+            await asyncio.wait((self._disconnect_task,))
+
         if self._client and self._client.is_connected:
             return
 
@@ -271,33 +315,143 @@ class BasestationAPI:
                 return  # recheck while locked
 
             _LOGGER.debug("%s (%s): Connecting", self.name, self.address)
-            client = await establish_connection(
-                BleakClientWithServiceCache,
-                self._ble_device,
-                self.name,
-                use_services_cache=True,
-                ble_device_callback=lambda: self._ble_device,
-            )
+            async with _CONNECT_SEMAPHORE:
+                client = await establish_connection(
+                    BleakClientWithServiceCache,
+                    self._ble_device,
+                    self.name,
+                    use_services_cache=True,
+                    ble_device_callback=lambda: self._ble_device,
+                )
 
             self._client = client
 
     async def disconnect(self) -> None:
         """Disconnect."""
+        self._cancel_disconnect()
+        if self._client is None and not self._connect_lock.locked():
+            return  # nothing to disconnect and no connection being established
+
         async with self._connect_lock:
             client = self._client
 
             self._client = None
+            self._chars = {}
 
             _LOGGER.debug("%s (%s): Disconnecting", self.name, self.address)
             if client and client.is_connected:
                 await client.disconnect()
 
+    async def stop(self) -> None:
+        """Cancel pending writes and updates, then disconnect."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for waiter in self._pending_write_waiters:
+            waiter.cancel()
+        self._pending_writes = {}
+        self._pending_write_waiters = []
+
+        tasks = [
+            task
+            for task in (*self._flush_tasks, self._update_task)
+            if task and not task.done()
+        ]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
+
+        await self.disconnect()
+
+    @asynccontextmanager
+    async def _operation(self) -> AsyncIterator[None]:
+        # Updates and write flushes share the connection, so the idle disconnect
+        # only starts once the last of them finished. A failed operation likely
+        # left the connection unusable, so it is dropped right away.
+        self._active_operations += 1
+        try:
+            yield
+        except BaseException:
+            await self.disconnect()
+            raise
+        finally:
+            self._active_operations -= 1
+            if not self._active_operations and self._client:
+                self._schedule_disconnect()
+
+    def _schedule_disconnect(self) -> None:
+        # Keep the connection around for a moment so that operations following
+        # each other closely, e.g. a write and the next poll, can reuse it.
+        self._cancel_disconnect()
+        self._disconnect_handle = asyncio.get_running_loop().call_later(
+            DISCONNECT_DELAY_SECONDS, self._disconnect_idle
+        )
+
+    def _cancel_disconnect(self) -> None:
+        if self._disconnect_handle:
+            self._disconnect_handle.cancel()
+            self._disconnect_handle = None
+
+    def _disconnect_idle(self) -> None:
+        self._disconnect_handle = None
+        self._disconnect_task = asyncio.get_running_loop().create_task(
+            self.disconnect()
+        )
+
+    async def _write_char_debounced(self, char: str, command: bytes) -> None:
+        # Writes arriving within the debounce window are collapsed to the last
+        # value per characteristic and sent together over a single connection.
+        loop = asyncio.get_running_loop()
+        self._pending_writes.pop(char, None)  # keep the order of the latest writes
+        self._pending_writes[char] = command
+        waiter: asyncio.Future[None] = loop.create_future()
+        self._pending_write_waiters.append(waiter)
+
+        if self._flush_handle:
+            self._flush_handle.cancel()
+        self._flush_handle = loop.call_later(
+            WRITE_DEBOUNCE_SECONDS, self._flush_pending_writes
+        )
+        await waiter
+
+    def _flush_pending_writes(self) -> None:
+        self._flush_handle = None
+        writes, self._pending_writes = self._pending_writes, {}
+        waiters, self._pending_write_waiters = self._pending_write_waiters, []
+        task = asyncio.get_running_loop().create_task(
+            self._write_chars(writes, waiters)
+        )
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _write_chars(
+        self, writes: dict[str, bytes], waiters: list[asyncio.Future[None]]
+    ) -> None:
+        try:
+            # Batches are written one after another in the order they were
+            # flushed, so a retried write cannot land after a newer one.
+            async with self._write_lock, self._operation():
+                for char, command in writes.items():
+                    await self._write_char(char, command)
+        except asyncio.CancelledError:
+            for waiter in waiters:
+                waiter.cancel()
+            raise
+        except Exception as ex:  # noqa: BLE001
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(ex)
+        else:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+
     @retry_bluetooth_connection_error(BLE_RETRY_ATTEMPTS)
     async def _write_char(
         self,
-        char: BleakGATTCharacteristic | int | str | UUID,
-        commands: list[bytes],
-        disconnect: bool = False,  # noqa: FBT001 FBT002
+        char: str,
+        command: bytes,
     ) -> None:
         try:
             await self.connect()
@@ -306,33 +460,38 @@ class BasestationAPI:
                 self.name,
                 self.address,
                 char,
-                [command.hex() for command in commands],
+                command,
             )
-            for command in commands:
-                await self._client.write_gatt_char(char, command, response=True)
-        finally:
-            if disconnect:
-                await self.disconnect()
+            gatt_char = self._get_char(char)
+            # Writes without response only need to be queued, not acknowledged
+            response = "write-without-response" not in gatt_char.properties
+            async with asyncio.timeout(GATT_TIMEOUT_SECONDS):
+                await self._client.write_gatt_char(
+                    gatt_char, command, response=response
+                )
+        except BLEAK_EXCEPTIONS:
+            # Drop the broken connection so that a retry starts from a fresh one
+            await self.disconnect()
+            raise
 
-    @retry_bluetooth_connection_error(BLE_RETRY_ATTEMPTS)
-    async def _read_char(
-        self,
-        char: BleakGATTCharacteristic | int | str | UUID,
-        disconnect: bool = False,  # noqa: FBT001 FBT002
-    ) -> bytearray:
-        try:
-            await self.connect()
-            _LOGGER.debug(
-                "%s (%s): Reading characteristic %s",
-                self.name,
-                self.address,
-                char,
+    async def _read_chars(self, *chars: str) -> list[bytearray]:
+        await self.connect()
+        async with asyncio.timeout(GATT_TIMEOUT_SECONDS):
+            return await asyncio.gather(
+                *(self._read_char_nolock(char) for char in chars)
             )
-            read = await self._client.read_gatt_char(char)
-        finally:
-            if disconnect:
-                await self.disconnect()
 
+    async def _read_char_nolock(
+        self,
+        char: str,
+    ) -> bytearray:
+        _LOGGER.debug(
+            "%s (%s): Reading characteristic %s",
+            self.name,
+            self.address,
+            char,
+        )
+        read = await self._client.read_gatt_char(self._get_char(char))
         _LOGGER.debug(
             "%s (%s): Read characteristic %s: %s",
             self.name,
@@ -342,9 +501,17 @@ class BasestationAPI:
         )
         return read
 
+    def _get_char(self, uuid: str) -> BleakGATTCharacteristic:
+        # Resolved once per connection, the handles may change on reconnect
+        if char := self._chars.get(uuid):
+            return char
+        char = self._chars[uuid] = _require_characteristic(self._client.services, uuid)
+        return char
+
     def _fire_callbacks(self) -> None:
-        for callback in self._callbacks:
-            callback(self._state)
+        state = self._state
+        for callback in tuple(self._callbacks):
+            callback(state)
 
     def register_callback(
         self, callback: Callable[[BasestationState], None]
@@ -352,7 +519,7 @@ class BasestationAPI:
         """Register callbacks to call when the state changes."""
 
         def unregister_callback() -> None:
-            self._callbacks.remove(callback)
+            self._callbacks.discard(callback)
 
-        self._callbacks.append(callback)
+        self._callbacks.add(callback)
         return unregister_callback
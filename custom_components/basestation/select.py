@@ -7,6 +7,9 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .coordinator import BasestationCoordinator
 from .entity import BasestationEntity
+from .lib import CHANNEL_NUM_MAX, CHANNEL_NUM_MIN
+
+_CHANNEL_OPTIONS = [str(i) for i in range(CHANNEL_NUM_MIN, CHANNEL_NUM_MAX + 1)]
 
 
 async def async_setup_entry(
@@ -24,18 +27,20 @@ class BasestationChannelSelect(BasestationEntity, SelectEntity):
 
     _attr_entity_registry_enabled_default = False
     _attr_icon = "mdi:list-box"
+    _attr_options = _CHANNEL_OPTIONS
 
     def __init__(
         self,
         coordinator: BasestationCoordinator,
     ) -> None:
         """Initialize the channel select."""
-        super().__init__(coordinator)
-        self.entity_description = SelectEntityDescription(
-            key="channel",
-            name="Channel",
+        super().__init__(
+            coordinator,
+            SelectEntityDescription(
+                key="channel",
+                name="Channel",
+            ),
         )
-        self._attr_options = [str(i) for i in range(1, 16)]
 
     @property
     def current_option(self) -> str:
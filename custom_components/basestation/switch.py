@@ -33,11 +33,13 @@ class BasestationPowerSwitch(BasestationEntity, SwitchEntity):
         coordinator: BasestationCoordinator,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator)
-        self.entity_description = SwitchEntityDescription(
-            key="power",
-            name="Power",
-            device_class=SwitchDeviceClass.SWITCH,
+        super().__init__(
+            coordinator,
+            SwitchEntityDescription(
+                key="power",
+                name="Power",
+                device_class=SwitchDeviceClass.SWITCH,
+            ),
         )
 
     @property